@@ -1,6 +1,5 @@
 from __future__ import annotations
 
-import json
 import os
 import re
 import shutil
@@ -35,50 +34,63 @@ DJ_LTS = [
 DJ_DEFAULT = DJ_LTS[0]
 DJ_LATEST = DJ_VERSIONS[-2]
 
+RETURNED_CODE_RE = re.compile(r"Returned code (\d+)")
+NEW_VERSION_RE = re.compile(r"New Version: (.+)")
+
 
 def version(ver: str) -> tuple[int, ...]:
     """Convert a string version to a tuple of ints, e.g. "3.10" -> (3, 10)"""
     return tuple(map(int, ver.split(".")))
 
 
+def leading_digits(value: str) -> str:
+    return value[: len(value) - len(value.lstrip("0123456789"))]
+
+
 def display_version(raw: str) -> str:
-    match = re.match(r"\d+(?:\.\d+)?", raw)
-    return match.group(0) if match else raw
+    major = leading_digits(raw)
+    if not major:
+        return raw
+    rest = raw[len(major) :]
+    minor = leading_digits(rest[1:]) if rest.startswith(".") else ""
+    return f"{major}.{minor}" if minor else major
 
 
 def should_skip(python: str, django: str) -> bool:
     """Return True if the test should be skipped"""
 
-    if django == DJMAIN and version(python) < version(DJMAIN_MIN_PY):
+    python_version = version(python)
+
+    if django == DJMAIN and python_version < version(DJMAIN_MIN_PY):
         # Django main requires Python 3.12+
         return True
 
-    if django in {DJ60, DJ61} and version(python) < version(PY312):
+    if django in {DJ60, DJ61} and python_version < version(PY312):
         # Django 6.0 and 6.1 require Python 3.12+
         return True
 
-    if django == DJ52 and version(python) < version(PY310):
+    if django == DJ52 and python_version < version(PY310):
         # Django 5.2 requires Python 3.10+
         return True
 
     return False
 
 
+TEST_MATRIX = [
+    (python, django)
+    for python in PY_VERSIONS
+    for django in DJ_VERSIONS
+    if not should_skip(python, django)
+]
+
+
 @nox.session
 def test(session):
     session.notify(f"tests(python='{PY_DEFAULT}', django='{DJ_DEFAULT}')")
 
 
 @nox.session
-@nox.parametrize(
-    "python,django",
-    [
-        (python, django)
-        for python in PY_VERSIONS
-        for django in DJ_VERSIONS
-        if not should_skip(python, django)
-    ],
-)
+@nox.parametrize("python,django", TEST_MATRIX)
 def tests(session, django):
     session.run_install(
         "uv",
@@ -184,7 +196,7 @@ def lint(session):
                 break
             except CommandFailed as e:
                 # Parse exit code from exception reason: "Returned code X"
-                match = re.search(r"Returned code (\d+)", e.reason or "")
+                match = RETURNED_CODE_RE.search(e.reason or "")
                 exit_code = int(match.group(1)) if match else None
 
                 # Only retry on exit code 3 (infrastructure error)
@@ -260,7 +272,7 @@ def copy_bench_fixtures(session):
         dest_path = dest_base / dest
         dest_path.parent.mkdir(parents=True, exist_ok=True)
         src_path = Path(django_path) / src
-        shutil.copy2(src_path, dest_path)
+        shutil.copyfile(src_path, dest_path)
 
 
 @nox.session
@@ -270,23 +282,16 @@ def gha_matrix(session):
         "ubuntu-latest"
     ]
 
-    sessions = session.run("nox", "-l", "--json", external=True, silent=True)
     versions_list = [
-        {
-            "django-version": session["call_spec"]["django"],
-            "python-version": session["python"],
-        }
-        for session in json.loads(sessions)
-        if session["name"] == "tests"
+        {"django-version": django, "python-version": python}
+        for python, django in TEST_MATRIX
     ]
 
-    # Build the matrix, excluding Python 3.9 on macOS (PyO3 linking issues)
-    include_list = []
-    for os_name in os_list:
-        for combo in versions_list:
-            include_list.append({**combo, "os": os_name})
-
-    matrix = {"include": include_list}
+    matrix = {
+        "include": [
+            {**combo, "os": os_name} for os_name in os_list for combo in versions_list
+        ]
+    }
 
     if os.environ.get("GITHUB_OUTPUT"):
         with Path(os.environ["GITHUB_OUTPUT"]).open("a") as fh:
@@ -321,9 +326,8 @@ def update_changelog(session, version):
     with open("CHANGELOG.md", "r") as f:
         changelog = f.read()
 
-    changelog = changelog.replace("## [Unreleased]", f"## [{version}]", 1)
     changelog = changelog.replace(
-        f"## [{version}]", f"## [Unreleased]\n\n## [{version}]"
+        "## [Unreleased]", f"## [Unreleased]\n\n## [{version}]", 1
     )
 
     repo_url = session.run(
@@ -333,40 +337,42 @@ def update_changelog(session, version):
 
     changelog = changelog.rstrip("\n")
     changelog += f"\n[{version}]: {repo_url}/releases/tag/v{version}\n"
-    changelog = re.sub(
-        r"\[unreleased\]: .+",
-        f"[unreleased]: {repo_url}/compare/v{version}...HEAD",
-        changelog,
-    )
+    head, marker, tail = changelog.partition("[unreleased]: ")
+    if marker:
+        _, newline, rest = tail.partition("\n")
+        changelog = f"{head}{marker}{repo_url}/compare/v{version}...HEAD{newline}{rest}"
 
     with open("CHANGELOG.md", "w") as f:
         f.write(changelog)
 
-    session.run("git", "add", "CHANGELOG.md", external=True)
     session.run(
         "git",
         "commit",
         "-m",
         f"update CHANGELOG for version {version}",
+        "--",
+        "CHANGELOG.md",
         external=True,
         silent=True,
     )
 
 
 def update_uvlock(session, version):
+    uvlock = Path("uv.lock")
+    previous = uvlock.read_bytes()
     session.run("uv", "lock")
 
-    git_status = session.run("git", "status", "--porcelain", external=True, silent=True)
-    if "uv.lock" not in git_status:
+    if uvlock.read_bytes() == previous:
         session.log("No changes to uv.lock, skipping commit")
         return
 
-    session.run("git", "add", "uv.lock", external=True)
     session.run(
         "git",
         "commit",
         "-m",
         f"update uv.lock for version {version}",
+        "--",
+        "uv.lock",
         external=True,
         silent=True,
     )
@@ -391,19 +397,15 @@ def release(session):
     cog(session)
     session.run(
         "git",
-        "add",
+        "commit",
+        "-m",
+        f"run cog for version {version}",
+        "--",
         "Cargo.lock",
         "CONTRIBUTING.md",
         "README.md",
         "pyproject.toml",
         external=True,
-    )
-    session.run(
-        "git",
-        "commit",
-        "-m",
-        f"run cog for version {version}",
-        external=True,
         silent=True,
     )
 
@@ -427,5 +429,5 @@ def get_version(session):
                 args.extend(arg.split(" "))
         command.extend(args)
     output = session.run(*command, silent=True)
-    match = re.search(r"New Version: (.+)", output)
+    match = NEW_VERSION_RE.search(output)
     return to_pep440(match.group(1)) if match else None
@@ -7,6 +7,8 @@ import sys
 from pathlib import Path
 from typing import Any
 
+DJANGO_TEMPLATES_BACKEND = "django.template.backends.django.DjangoTemplates"
+
 
 def main() -> None:
     args = parse_args()
@@ -55,42 +57,40 @@ def collect_template_dirs(project: Path, site_packages: Path) -> list[str]:
 
     dirs = []
     for engine in settings.TEMPLATES:
-        if "django" not in engine["BACKEND"].lower():
+        if engine["BACKEND"] != DJANGO_TEMPLATES_BACKEND:
             continue
 
         dirs.extend(Path(path) for path in engine.get("DIRS", []))
 
         if engine.get("APP_DIRS", False):
             for app_config in apps.get_app_configs():
-                template_dir = Path(app_config.path) / "templates"
-                if template_dir.exists():
-                    dirs.append(template_dir)
+                template_dir = os.path.join(app_config.path, "templates")
+                if os.path.isdir(template_dir):
+                    dirs.append(Path(template_dir))
 
     return [normalize_path(path, project, site_packages) for path in dirs]
 
 
 def collect_template_library_catalog() -> dict[str, Any]:
     from django.template.engine import Engine
-    from django.template.library import import_library
 
     engine = Engine.get_default()
     builtins = []
+    seen_builtins = set()
     symbols = []
 
     for builtin_module, library in zip(engine.builtins, engine.template_builtins):
-        if builtin_module in builtins:
+        if builtin_module in seen_builtins:
             continue
+        seen_builtins.add(builtin_module)
         builtins.append(builtin_module)
         symbols.extend(symbol_rows(library, builtin_module, None))
 
+    # The engine imports every library when it is constructed, so reuse those
+    # instances instead of importing each module a second time.
     libraries = dict(sorted(engine.libraries.items()))
     for load_name, library_module in libraries.items():
-        try:
-            library = import_library(library_module)
-        except Exception as exc:
-            raise RuntimeError(
-                f"failed to import Django template library {library_module}"
-            ) from exc
+        library = engine.template_libraries[load_name]
         symbols.extend(symbol_rows(library, library_module, load_name))
 
     symbols.sort(
@@ -110,28 +110,17 @@ def collect_template_library_catalog() -> dict[str, Any]:
 
 
 def symbol_rows(library: Any, library_module: str, load_name: str | None) -> list[dict[str, str | None]]:
-    rows = []
-    for name, tag_func in sorted(library.tags.items()):
-        rows.append(
-            {
-                "kind": "tag",
-                "name": name,
-                "load_name": load_name,
-                "library_module": library_module,
-                "module": tag_func.__module__,
-            }
-        )
-    for name, filter_func in sorted(library.filters.items()):
-        rows.append(
-            {
-                "kind": "filter",
-                "name": name,
-                "load_name": load_name,
-                "library_module": library_module,
-                "module": filter_func.__module__,
-            }
-        )
-    return rows
+    return [
+        {
+            "kind": kind,
+            "name": name,
+            "load_name": load_name,
+            "library_module": library_module,
+            "module": func.__module__,
+        }
+        for kind, registry in (("tag", library.tags), ("filter", library.filters))
+        for name, func in sorted(registry.items())
+    ]
 
 
 def normalize_path(path: Path, project: Path, site_packages: Path) -> str: